@@ -1,5 +1,6 @@
 from PyForks import Region
 import PyForks.exceptions
+import PyForks.region
 import pytest
 import pandas as pd
 import os
@@ -14,6 +15,57 @@ else:
     APP_ID = os.getenv("APP_ID")
     APP_SECRET = os.getenv("APP_SECRET")
 
+REGION_RECORD = {
+    "rid": 20367,
+    "title": "West Lake Marion Park",
+    "total_ridelogs": 100,
+    "total_trails": "26",
+    "total_distance": 1000,
+    "total_descent_distance": 100,
+    "highest_trailhead": 300,
+    "total_reports": 5,
+    "total_photos": 2,
+    "ridden": 100,
+    "country_title": "United States",
+    "prov_title": "Minnesota",
+    "city_title": "Lakeville",
+    "links": [],
+    "faved": 1,
+    "rating": 4,
+    "created": 1600000000,
+}
+
+
+class StubResponse:
+    status_code = 200
+
+    def __init__(self, data):
+        self.data = data
+
+    def json(self):
+        return {"error": 0, "message": "", "data": self.data}
+
+
+class StubSession:
+    """
+    Stands in for requests.Session so region lookups can be counted without
+    hitting the Trailforks API
+    """
+
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, uri, params=None):
+        self.calls += 1
+        return StubResponse([REGION_RECORD])
+
+
+def stub_region(**kwargs):
+    region = Region(app_id="app_id", app_secret="app_secret", **kwargs)
+    region.trailforks_session = StubSession()
+    return region
+
+
 def test_nonexistant_region():
     region = Region(app_id=APP_ID, app_secret=APP_SECRET)
     assert region.is_valid_region("bullcrap_region") == False
@@ -149,4 +201,76 @@ def test_auth_bad_api():
     region = Region(app_id="no_exist", app_secret="secret_squirrel")
     with pytest.raises(PyForks.exceptions.TrailforksAPIException) as pytest_wrapped_e:
         region_dict = region.get_region_info("west-lake-marion-park")
-    assert pytest_wrapped_e.type == PyForks.exceptions.TrailforksAPIException
\ No newline at end of file
+    assert pytest_wrapped_e.type == PyForks.exceptions.TrailforksAPIException
+
+def test_region_id_by_alias():
+    region = Region(app_id=APP_ID, app_secret=APP_SECRET)
+    assert region.get_region_id_by_alias("west-lake-marion-park") == 20367
+    assert region.get_region_id_by_alias("west-lake-marion-park") == 20367
+
+
+def test_region_id_by_bad_alias():
+    region = Region(app_id=APP_ID, app_secret=APP_SECRET)
+    with pytest.raises(PyForks.exceptions.InvalidRegion) as pytest_wrapped_e:
+        region.get_region_id_by_alias("fake_004957856934")
+    assert pytest_wrapped_e.type == PyForks.exceptions.InvalidRegion
+
+
+def test_region_cache_single_request():
+    region = stub_region()
+    region.check_region("west-lake-marion-park")
+    info = region.get_region_info("west-lake-marion-park")
+    assert info["region_title"] == "West Lake Marion Park"
+    assert region.trailforks_session.calls == 1
+
+    region.get_region_info("west-lake-marion-park")
+    assert region.trailforks_session.calls == 1
+
+    region.invalidate_region("west-lake-marion-park")
+    region.get_region_info("west-lake-marion-park")
+    assert region.trailforks_session.calls == 2
+
+
+def test_region_cache_ttl_expiry(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(PyForks.region.time, "monotonic", lambda: now[0])
+    region = stub_region(region_cache_ttl=300)
+    region.check_region("west-lake-marion-park")
+    now[0] += 299
+    region.check_region("west-lake-marion-park")
+    assert region.trailforks_session.calls == 1
+
+    now[0] += 1
+    region.check_region("west-lake-marion-park")
+    assert region.trailforks_session.calls == 2
+
+
+def test_region_cache_lru_eviction():
+    region = stub_region(region_cache_size=2)
+    region.check_region("region-a")
+    region.check_region("region-b")
+    region.check_region("region-a")
+    region.check_region("region-c")
+    assert region.trailforks_session.calls == 3
+
+    # region-a was used more recently than region-b, so region-b was evicted
+    region.check_region("region-a")
+    assert region.trailforks_session.calls == 3
+    region.check_region("region-b")
+    assert region.trailforks_session.calls == 4
+
+
+def test_region_cache_disabled():
+    region = stub_region(region_cache_size=0)
+    region.check_region("west-lake-marion-park")
+    region.check_region("west-lake-marion-park")
+    assert region.trailforks_session.calls == 2
+
+
+def test_ridecounts_day_and_month_names():
+    # every stubbed page holds REGION_RECORD, created 2020-09-13 (a Sunday)
+    region = stub_region()
+    df = region.get_region_ridecounts("west-lake-marion-park")
+    assert df["weekday"].to_list() == ["Sunday"]
+    assert df["month_name"].to_list() == ["Sep"]
+    assert df["rides"].to_list() == [1]
@@ -2,6 +2,7 @@ from PyForks import Trailforks
 import PyForks.exceptions
 import pytest
 import os
+import time
 
 
 def test_distance_cleaning():
@@ -14,3 +15,41 @@ def test_distance_cleaning():
 
     assert clean_distances == expected_distances
 
+
+
+
+class DelayedResponse:
+    status_code = 200
+
+    def __init__(self, data):
+        self.data = data
+
+    def json(self):
+        return {"error": 0, "message": "", "data": self.data}
+
+
+class DelayedSession:
+    """
+    Stands in for requests.Session, answering each page after a delay that
+    shrinks as the page number grows so later pages finish first
+    """
+
+    def get(self, uri, params=None):
+        page = params["page"]
+        time.sleep(0.05 * (4 - page))
+        return DelayedResponse([{"page": page}])
+
+
+def test_batch_requests_keep_order():
+    tf = Trailforks(app_id="app_id", app_secret="app_secret", max_workers=4)
+    tf.trailforks_session = DelayedSession()
+    params = [{"page": page} for page in range(4)]
+    results = tf.make_trailforks_requests("https://www.trailforks.com/api/1/regions", params)
+    assert isinstance(results, list)
+    assert results == [[{"page": 0}], [{"page": 1}], [{"page": 2}], [{"page": 3}]]
+
+
+def test_batch_requests_empty():
+    tf = Trailforks(app_id="app_id", app_secret="app_secret")
+    tf.trailforks_session = DelayedSession()
+    assert tf.make_trailforks_requests("https://www.trailforks.com/api/1/regions", []) == []
@@ -1,13 +1,136 @@
 import pandas as pd
+import numpy as np
+import pyarrow.parquet as pq
 import logging
-from datetime import datetime
+import math
+import time
+from collections import Counter
 import PyForks.exceptions
-import calendar
 from tqdm import tqdm
+from functools import lru_cache
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from PyForks.trailforks import Trailforks, authentication
 
+# fixed English names (calendar.day_name/month_abbr follow the process locale);
+# month abbreviations are 1-indexed to line up with .dt.month
+_DAY_NAMES = np.array(
+    ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+)
+_MONTH_ABBRS = np.array(
+    ["", "Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+)
+
+
+@lru_cache(maxsize=1)
+def _load_region_ids(region_data_file: str) -> dict:
+    """
+    Reads the alias and rid columns of the bundled region parquet file once
+    per process and builds an alias -> region id lookup table
+
+    Args:
+        region_data_file (str): path to region_data.parquet
+
+    Returns:
+        dict: {alias: rid}
+    """
+    table = pq.read_table(region_data_file, columns=["alias", "rid"]).to_pydict()
+    return dict(zip(table["alias"], map(int, table["rid"])))
+
+
 class Region(Trailforks):
+    def __init__(self, *args, region_cache_ttl=300, region_cache_size=256, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.region_cache_ttl = region_cache_ttl
+        self.region_cache_size = region_cache_size
+        self._region_cache = {}
+
+    def _cached_region_lookup(self, kind: str, region: str, lookup):
+        """
+        Serves region lookups from a small in-memory TTL + LRU cache so
+        repeated calls for the same region don't hit the API. A cache size
+        or TTL of 0 (or less) disables caching.
+
+        Args:
+            kind (str): type of lookup being cached (ex: region)
+            region (str): region name as is shows on a URI
+            lookup (callable): zero-argument function that fetches the value
+
+        Returns:
+            Any: cached or freshly fetched value
+        """
+        if self.region_cache_size <= 0 or self.region_cache_ttl <= 0:
+            return lookup()
+
+        key = (kind, region)
+        now = time.monotonic()
+        entry = self._region_cache.pop(key, None)
+        if entry is not None and now - entry[0] < self.region_cache_ttl:
+            # re-insert so the dict stays ordered least -> most recently used
+            self._region_cache[key] = entry
+            return entry[1]
+
+        value = lookup()
+        while self._region_cache and len(self._region_cache) >= self.region_cache_size:
+            # dicts keep insertion order, so the first key is the least recently used
+            self._region_cache.pop(next(iter(self._region_cache)))
+        self._region_cache[key] = (now, value)
+        return value
+
+    def invalidate_region(self, region: str) -> None:
+        """
+        Drops any cached lookups for a region so the next call goes back
+        to the Trailforks API
+
+        Args:
+            region (str): region name as is shows on a URI
+        """
+        for key in [k for k in self._region_cache if k[1] == region]:
+            self._region_cache.pop(key, None)
+
+    def _get_region_record(self, region: str) -> dict:
+        """
+        Pulls the detailed Trailforks API record for a region alias. The
+        same response answers is_valid_region() and get_region_info(), so
+        it is fetched once and cached.
+
+        Args:
+            region (str): region name as is shows on a URI
+
+        Returns:
+            dict: detailed region record, None if the region does not exist
+        """
+        def lookup() -> dict:
+            filter = self.uri_encode(f"alias::{region}")
+            uri = f"https://www.trailforks.com/api/1/regions?filter={filter}&scope=detailed&app_id={self.app_id}&app_secret={self.app_secret}"
+            json_response = self.make_trailforks_request(uri)
+            if len(json_response) == 0:
+                return None
+            return json_response[0]
+
+        return self._cached_region_lookup("region", region, lookup)
+
+    def _resolve_region(self, region: str) -> dict:
+        """
+        Validates a region alias and returns its detailed record in a single
+        (cached) API call. The record carries everything the public methods
+        need up front: rid, ridden, title, etc.
+
+        Args:
+            region (str): region name as is shows on a URI
+
+        Raises:
+            PyForks.exceptions.InvalidRegion: region does not exist
+
+        Returns:
+            dict: detailed region record
+        """
+        region_record = self._get_region_record(region)
+        if region_record is None:
+            raise PyForks.exceptions.InvalidRegion(
+                msg=f"[!] {region} is not a valid Trailforks Region."
+            )
+        return region_record
+
     def is_valid_region(self, region: str) -> bool:
         """
         Check to make sure a region name is a real region by
@@ -16,12 +139,7 @@ class Region(Trailforks):
         Returns:
             bool: True:is an existing region;False:region does not exist.
         """  # noqa
-        filter = self.uri_encode(f"alias::{region}")
-        uri = f"https://www.trailforks.com/api/1/regions?filter={filter}&app_id={self.app_id}&app_secret={self.app_secret}"
-        json_response = self.make_trailforks_request(uri)
-        if len(json_response) == 0:
-            return False
-        return True
+        return self._get_region_record(region) is not None
 
     def check_region(self, region: str) -> bool:
         """
@@ -31,10 +149,7 @@ class Region(Trailforks):
         Returns:
             bool: True: Region is valid
         """  # noqa
-        if not self.is_valid_region(region):
-            raise PyForks.exceptions.InvalidRegion(
-                msg=f"[!] {region} is not a valid Trailforks Region."
-            )
+        self._resolve_region(region)
         return True
 
     def __enrich_ridecounts(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -53,8 +168,9 @@ class Region(Trailforks):
         df["month"] = df["date"].dt.month
         df["day"] = df["date"].dt.day
         df["weekday_num"] = df["date"].dt.weekday
-        df["weekday"] = df["date"].dt.day_name()
-        df["month_name"] = df["month"].apply(lambda x: calendar.month_abbr[x])
+        # gather names by index rather than per-row Python lookups
+        df["weekday"] = _DAY_NAMES[df["weekday_num"].to_numpy()]
+        df["month_name"] = _MONTH_ABBRS[df["month"].to_numpy()]
 
         return df
 
@@ -70,29 +186,32 @@ class Region(Trailforks):
         Returns:
             pd.DataFrame: pd.DataFrame(columns=["username","rides"])
         """ # noqa
-        self.check_region(region)
+        region_record = self._resolve_region(region)
         rows_per_pull = 8000
-        page_number = 0
-        enumerated_results = 0
-        fields = self.uri_encode("created,username")
-        region_id = self.get_region_id_by_alias(region)
-        region_info = self.get_region_info(region)
-        total_ridelogs = int(region_info["ridden"])
-        region_filter = self.uri_encode(f"::{region_id}")
+        total_ridelogs = int(region_record["ridden"])
+        total_pages = math.ceil(total_ridelogs / rows_per_pull)
+        uri = "https://www.trailforks.com/api/1/ridelogs"
+        params = {
+            "fields": "created,username",
+            "filter": f"rid::{region_record['rid']}",
+            "rows": rows_per_pull,
+            "order": "desc",
+            "sort": "created",
+            "app_id": self.app_id,
+            "app_secret": self.app_secret,
+        }
         dfs = []
 
         threads = []
-        with ThreadPoolExecutor() as executor:
-
-            while enumerated_results < total_ridelogs:
-                uri = f"https://www.trailforks.com/api/1/ridelogs?fields={fields}&filter=rid{region_filter}&rows={rows_per_pull}&page={page_number}&order=desc&sort=created&app_id={self.app_id}&app_secret={self.app_secret}"
-                threads.append(executor.submit(self.make_trailforks_request, uri))
-                page_number += 1
-                enumerated_results += rows_per_pull
-                
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+
+            for page_number in range(total_pages):
+                page_params = {**params, "page": page_number}
+                threads.append(executor.submit(self.make_trailforks_request, uri, page_params))
+
             for job in as_completed(threads):
                 json_response = job.result()
-                dfs.append(pd.json_normalize(json_response))
+                dfs.append(pd.DataFrame.from_records(json_response))
 
         df = pd.concat(dfs, ignore_index=True)
         t_df = df.groupby(['username'], sort=True).count().sort_values(by='created', ascending=False).reset_index()
@@ -112,33 +231,42 @@ class Region(Trailforks):
         Returns:
             pd.DataFrame: pd.DataFrame(columns=["date","rides"])
         """ # noqa
-        self.check_region(region)
+        region_record = self._resolve_region(region)
         rows_per_pull = 10000
-        page_number = 0
-        enumerated_results = 0
-        fields = self.uri_encode("created")
-        region_id = self.get_region_id_by_alias(region)
-        region_info = self.get_region_info(region)
-        total_ridelogs = int(region_info["ridden"])
-        region_filter = self.uri_encode(f"::{region_id}")
-        dfs = []
+        total_ridelogs = int(region_record["ridden"])
+        total_pages = math.ceil(total_ridelogs / rows_per_pull)
+        uri = "https://www.trailforks.com/api/1/ridelogs"
+        params = {
+            "fields": "created",
+            "filter": f"rid::{region_record['rid']}",
+            "rows": rows_per_pull,
+            "order": "desc",
+            "sort": "created",
+            "app_id": self.app_id,
+            "app_secret": self.app_secret,
+        }
+        day_counts = Counter()
 
         threads = []
-        with ThreadPoolExecutor() as executor:
-
-            while enumerated_results < total_ridelogs:
-                uri = f"https://www.trailforks.com/api/1/ridelogs?fields={fields}&filter=rid{region_filter}&rows={rows_per_pull}&page={page_number}&order=desc&sort=created&app_id={self.app_id}&app_secret={self.app_secret}"
-                threads.append(executor.submit(self.make_trailforks_request, uri))
-                page_number += 1
-                enumerated_results += rows_per_pull
-                
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+
+            for page_number in range(total_pages):
+                page_params = {**params, "page": page_number}
+                threads.append(executor.submit(self.make_trailforks_request, uri, page_params))
+
             for job in as_completed(threads):
                 json_response = job.result()
-                dfs.append(pd.json_normalize(json_response))
-
-        df = pd.concat(dfs, ignore_index=True)
-        df["date"] = pd.to_datetime(df['created'],unit="s").dt.strftime("%Y-%m-%d")
-        t_df = df.groupby(['date'], sort=False)['date'].count().sort_index(ascending=False).reset_index(name="rides")
+                # bucket rides by UTC day (86400s) as pages arrive so only
+                # one counter per day is kept rather than one row per ride
+                day_counts.update(int(row["created"]) // 86400 for row in json_response)
+
+        days = np.fromiter(day_counts.keys(), dtype=np.int64, count=len(day_counts))
+        rides = np.fromiter(day_counts.values(), dtype=np.int64, count=len(day_counts))
+        t_df = pd.DataFrame({
+            "date": pd.to_datetime(days * 86400, unit="s").strftime("%Y-%m-%d"),
+            "rides": rides,
+        })
+        t_df = t_df.sort_values("date", ascending=False, ignore_index=True)
         return self.__enrich_ridecounts(t_df)
 
     @authentication
@@ -154,13 +282,17 @@ class Region(Trailforks):
             pd.DataFrame: Pandas DataFrame(columns=[created,title,difficulty,physical_rating,total_jumps,total_poi,alias,faved,stats])
         """
          # noqa
-        self.check_region(region)
-        fields = self.uri_encode("created,title,difficulty,physical_rating,total_jumps,total_poi,alias,faved,stats")
-        region_id = self.get_region_id_by_alias(region)
-        region_filter = self.uri_encode(f"rid::{region_id}")
-        rows = 100
-        uri = f"https://www.trailforks.com/api/1/trails?scope=full&fields={fields}&filter={region_filter}&rows={rows}&app_id={self.app_id}&app_secret={self.app_secret}"
-        json_response = self.make_trailforks_request(uri)
+        region_record = self._resolve_region(region)
+        uri = "https://www.trailforks.com/api/1/trails"
+        params = {
+            "scope": "full",
+            "fields": "created,title,difficulty,physical_rating,total_jumps,total_poi,alias,faved,stats",
+            "filter": f"rid::{region_record['rid']}",
+            "rows": 100,
+            "app_id": self.app_id,
+            "app_secret": self.app_secret,
+        }
+        json_response = self.make_trailforks_request(uri, params)
         df = pd.json_normalize(json_response)
         return df
 
@@ -179,27 +311,28 @@ class Region(Trailforks):
         Returns:
             bool: Pandas DataFrame(columns=[note,created,location_name,location_id,year,device_name,username])
         """  # noqa
-        self.check_region(region)
-        def get_date_string(row) -> int:
-            epoch = float(row["created"])
-            date = datetime.fromtimestamp(epoch).strftime("%m/%d/%Y")
-            return date
+        region_record = self._resolve_region(region)
+        uri = "https://www.trailforks.com/api/1/ridelogs"
+        params = {
+            "fields": "note,created,location_name,location_id,year,device_name,username",
+            "filter": f"rid::{region_record['rid']}",
+            "rows": 100,
+            "order": "desc",
+            "sort": "created",
+            "app_id": self.app_id,
+            "app_secret": self.app_secret,
+        }
+        page_params = [{**params, "page": page_number} for page_number in range(pages)]
+        records = []
 
-        rows_per_pull = 100
-        page_number = 0
-        fields = self.uri_encode("note,created,location_name,location_id,year,device_name,username")
-        region_id = self.get_region_id_by_alias(region)
-        region_filter = self.uri_encode(f"::{region_id}")
-        dfs = []
+        # pages come back in request order (newest first)
+        for json_response in self.make_trailforks_requests(uri, page_params):
+            records.extend(json_response)
 
-        for i in range(0,pages):
-            uri = f"https://www.trailforks.com/api/1/ridelogs?fields={fields}&filter=rid{region_filter}&rows={rows_per_pull}&page={page_number}&order=desc&sort=created&app_id={self.app_id}&app_secret={self.app_secret}"
-            json_response = self.make_trailforks_request(uri)
-            dfs.append(pd.json_normalize(json_response))
-            page_number += 1
-        
-        final_df = pd.concat(dfs, ignore_index=True)
-        final_df["date"] = final_df.apply(get_date_string, axis=1)
+        # the requested fields are flat scalars, so skip json_normalize's
+        # recursive flattening and build the frame once from the records
+        final_df = pd.DataFrame.from_records(records)
+        final_df["date"] = pd.to_datetime(final_df["created"].astype("int64"), unit="s").dt.strftime("%m/%d/%Y")
         return final_df
 
     def get_region_id_by_alias(self, region_alias: str) -> int:
@@ -213,9 +346,12 @@ class Region(Trailforks):
         Returns:
             int: Trailforks Region ID
         """
-        df = pd.read_parquet(self.region_data_file, engine="pyarrow")
-        region_id = df.loc[df["alias"] == region_alias, 'rid'].item()
-        return region_id
+        try:
+            return _load_region_ids(self.region_data_file)[region_alias]
+        except KeyError:
+            raise PyForks.exceptions.InvalidRegion(
+                msg=f"[!] {region_alias} is not a valid Trailforks Region."
+            )
     
     @authentication
     def get_region_info(self, region: str) -> dict:
@@ -247,10 +383,7 @@ class Region(Trailforks):
                 region_created      int
             }
         """  # noqa
-        self.check_region(region)
-        region_id = self.get_region_id_by_alias(region)
-        uri = f"https://www.trailforks.com/api/1/region?id={region_id}&scope=detailed&app_id={self.app_id}&app_secret={self.app_secret}"
-        json_response = self.make_trailforks_request(uri)
+        json_response = self._resolve_region(region)
 
         region_info = {
             "region_title": json_response["title"],
@@ -285,20 +418,33 @@ class Region(Trailforks):
             pd.DataFrame: DataFrame(columns=['rid', 'title', 'alias'])
         """
          # noqa
-        enumerated_results = 0
         page_number = 0
         results_per_page = 500
-        fields = self.uri_encode("rid,title,alias,country_title,prov_title,city_title")
+        max_pages = number_of_regions // results_per_page + 1
+        uri = "https://www.trailforks.com/api/1/regions"
+        params = {
+            "scope": "basic",
+            "fields": "rid,title,alias,country_title,prov_title,city_title",
+            "rows": results_per_page,
+            "app_id": self.app_id,
+            "app_secret": self.app_secret,
+        }
         dfs = []
-
-        pbar = tqdm(total=number_of_regions)
-        while enumerated_results <= number_of_regions:
-            uri = f"https://www.trailforks.com/api/1/regions?scope=basic&app_id={self.app_id}&fields={fields}&app_secret={self.app_secret}&rows={results_per_page}&page={page_number}"
-            json_response = self.make_trailforks_request(uri)
-            dfs.append(pd.json_normalize(json_response))
-            page_number += 1
-            enumerated_results += results_per_page
-            pbar.update(results_per_page)
+        last_page = False
+
+        pbar = tqdm(unit=" regions")
+        # fetch one batch of pages per worker pool and stop as soon as the
+        # API hands back a short page instead of requesting up to max_pages
+        while not last_page and page_number < max_pages:
+            batch = range(page_number, min(page_number + self.max_workers, max_pages))
+            page_params = [{**params, "page": page} for page in batch]
+            for json_response in self.make_trailforks_requests(uri, page_params):
+                dfs.append(pd.DataFrame.from_records(json_response))
+                pbar.update(len(json_response))
+                if len(json_response) < results_per_page:
+                    last_page = True
+                    break
+            page_number += len(batch)
         pbar.close()
         final_df = pd.concat(dfs)
         final_df.astype(str).drop_duplicates(inplace=True)
@@ -316,9 +462,9 @@ class Region(Trailforks):
         Returns:
             list: List of pinkbike photo links
         """
-        self.check_region(region)
+        region_record = self._resolve_region(region)
         photos = []
-        region_id = self.get_region_id_by_alias(region)
+        region_id = region_record["rid"]
         region_filter = self.uri_encode(f"::{region_id}")
         uri = f"https://www.trailforks.com/api/1/photos?filter=rid{region_filter}&rows=20&order=desc&app_id={self.app_id}&app_secret={self.app_secret}"
         json_response = self.make_trailforks_request(uri)
@@ -337,9 +483,9 @@ class Region(Trailforks):
         Returns:
             dict: Dict{videos: [{source, source_id, source_url}]}
         """
-        self.check_region(region)
+        region_record = self._resolve_region(region)
         videos = {'videos': []}
-        region_id = self.get_region_id_by_alias(region)
+        region_id = region_record["rid"]
         region_filter = self.uri_encode(f"::{region_id}")
         uri = f"https://www.trailforks.com/api/1/videos?filter=rid{region_filter}&rows=20&order=desc&app_id={self.app_id}&app_secret={self.app_secret}"
         json_response = self.make_trailforks_request(uri)
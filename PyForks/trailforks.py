@@ -4,6 +4,7 @@ import urllib.parse
 import logging
 import json
 import PyForks.exceptions
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 import pkg_resources
 
@@ -33,15 +34,22 @@ def authentication(func):
 
 
 class Trailforks:
-    def __init__(self, app_id=None, app_secret=None, debug=False):
+    def __init__(self, app_id=None, app_secret=None, debug=False, max_workers=8):
         self.__init_logger()
         self._logger = logging.getLogger("PyForks")
         self.name = "trailforks"
         self.app_id = app_id
         self.app_secret = app_secret
-        self.trailforks_session = requests.Session()
         self.region_data_file = pkg_resources.resource_filename("PyForks", "data/region_data.parquet")
         self.debug = debug
+        self.max_workers = max_workers
+        self.trailforks_session = requests.Session()
+        # size the keep-alive pool to the worker count so threaded page fetches
+        # reuse connections instead of discarding them when the pool is full
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=4, pool_maxsize=max(self.max_workers, 10)
+        )
+        self.trailforks_session.mount("https://", adapter)
 
         if self.debug:
             logging.basicConfig(stream=sys.stderr, level=logging.DEBUG)
@@ -128,18 +136,19 @@ class Trailforks:
         except TypeError:
             return True
 
-    def make_trailforks_request(self, uri: str) -> json:
+    def make_trailforks_request(self, uri: str, params: dict = None) -> json:
         """
         Makes a request give a URI
 
         Args:
             uri (str): URI String
+            params (dict, optional): query string parameters, encoded by requests. Defaults to None.
 
         Returns:
             json: Trailforks API response JSON Data object
         """
         try:
-            r = self.trailforks_session.get(uri)
+            r = self.trailforks_session.get(uri, params=params)
             url_json = r.json()
             self._handle_api_error(url_json)
             self._handle_status_code(r.status_code, url_json["message"])
@@ -150,6 +159,21 @@ class Trailforks:
                 msg="[!] ERROR: Bad API App or Secret Key"
             )
 
+    def make_trailforks_requests(self, uri: str, params: list) -> list:
+        """
+        Makes one request per params dict against the same URI concurrently,
+        fanning out over up to max_workers threads on the shared session
+
+        Args:
+            uri (str): URI String
+            params (list): query string parameter dicts (ex: one per page)
+
+        Returns:
+            list: Trailforks API response JSON Data objects, in the same order as params
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(self.make_trailforks_request, [uri] * len(params), params))
+
     def _handle_status_code(self, status_code: int, message: str) -> None:
         """
         Handle unauthenticated or incorrect permissions errors for HTTP requests
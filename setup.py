@@ -1,11 +1,11 @@
-from setuptools import setup
+from setuptools import setup, find_packages
 
 setup(
     name="PyForks",
     version="0.0.27",
     author="Trailforks Python Library",
     author_email="josh@mn-mtb.com",
-    packages=["PyForks"],
+    packages=find_packages(exclude=["*._test", "*._test.*"]),
     project_urls={  # Optional
         "Bug Reports": "https://github.com/cribdragg3r/PyForks/issues",
         "Funding": "https://donate.pypi.org",
@@ -26,6 +26,7 @@ setup(
         "tqdm",
         "requests",
         "pandas",
+        "numpy",
         "pyarrow"
     ],
 )